@@ -9,6 +9,9 @@ Servo servo;
 const int SERVO_PIN = 3;   // SG90 signal pin (yellow/orange wire)
 const int BUZZER_PIN = 8;  // Active buzzer, LOW = ON
 
+// Results are pushed by the serial bridge; STATUS_REQ is only a fallback
+const unsigned long STATUS_POLL_MS = 15000;
+
 // Medicine schedule slots
 const int NUM_SLOTS = 3;
 int hours[NUM_SLOTS] = {9, 13, 20};
@@ -58,19 +61,23 @@ void loop() {
       Serial.println(jobId);
     }
     else if (msg.startsWith("DISPENSE:OK:")) {
-      dispenseMedicine();
-      notifyDone();
-      moveToNextSlot();
+      if (isCurrentJob(msg.substring(12))) {
+        dispenseMedicine();
+        notifyDone();
+        moveToNextSlot();
+      }
     } 
     else if (msg.startsWith("DISPENSE:SKIP:")) {
-      notifyDone();
-      moveToNextSlot();
+      if (isCurrentJob(msg.substring(14))) {
+        notifyDone();
+        moveToNextSlot();
+      }
     }
   }
 
-  // Periodically poll backend for status updates
+  // Fallback poll in case a pushed result was lost
   static unsigned long lastPoll = 0;
-  if (dispensing && millis() - lastPoll > 2000) {
+  if (dispensing && millis() - lastPoll > STATUS_POLL_MS) {
     lastPoll = millis();
     if (jobId.length() > 0) {
       Serial.print("STATUS_REQ:");
@@ -81,6 +88,12 @@ void loop() {
   delay(50);
 }
 
+// Ignore results for other jobs and duplicates (push + fallback poll)
+bool isCurrentJob(String id) {
+  id.trim();
+  return dispensing && jobId.length() > 0 && id == jobId;
+}
+
 void startDispenseCycle() {
   dispensing = true;
   jobId = ""; // reset until backend sends a JOB_ID
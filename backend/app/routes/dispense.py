@@ -5,6 +5,7 @@ from app.services import dispenser
 from app.serial_bridge import write_to_serial
 
 router = APIRouter()
+MAX_STATUS_WAIT = 60.0  # seconds; upper bound for long-poll on /dispense-status
 
 class StartPayload(BaseModel):
     meta: dict = {}
@@ -20,8 +21,16 @@ def start_dispense(background_tasks: BackgroundTasks, payload: StartPayload | No
     return {"job_id": job_id, "status": "started"}
 
 @router.get("/dispense-status/{job_id}")
-def dispense_status(job_id: str):
-    job = dispenser.get_job(job_id)
+def dispense_status(job_id: str, wait: float = 0):
+    """
+    Return job state. With `?wait=N` this long-polls: the response is held
+    until the job is finished (or acknowledged) or N seconds pass, whichever
+    comes first. Clients should check `status` and re-issue on timeout.
+    """
+    if wait > 0:
+        job = dispenser.wait_for_job(job_id, timeout=min(wait, MAX_STATUS_WAIT))
+    else:
+        job = dispenser.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return {
@@ -37,8 +46,6 @@ def dispense_complete(job_id: str):
     Optional: called by Arduino or serial_bridge when dispensing physically completes.
     Marks job as acknowledged.
     """
-    job = dispenser.get_job(job_id)
-    if not job:
+    if not dispenser.acknowledge_job(job_id):
         raise HTTPException(status_code=404, detail="Job not found")
-    job["status"] = "acknowledged"
     return {"job_id": job_id, "status": "acknowledged"}
@@ -1,7 +1,6 @@
 # backend/app/serial_bridge.py
 import asyncio
 import serial
-import json
 import requests
 import time
 
@@ -9,8 +8,11 @@ SERIAL_PORT = "/dev/tty.usbserial-120"   # adjust to your Arduino port
 BAUD_RATE = 9600
 BACKEND_URL = "http://127.0.0.1:8000"
 OPEN_RETRY_DELAY = 2.0
+STATUS_WAIT = 30.0  # seconds each /dispense-status long-poll is held open
+MAX_PUSH_FAILURES = 5  # give up pushing after this many failed long-polls in a row
 
 serial_queue = asyncio.Queue()
+_push_tasks = set()  # keep references so watcher tasks are not garbage collected
 
 
 async def write_to_serial(message: str):
@@ -20,13 +22,13 @@ async def write_to_serial(message: str):
     await serial_queue.put(message if message.endswith("\n") else message + "\n")
 
 
-def send_to_backend(endpoint: str, data: dict = None):
+def send_to_backend(endpoint: str, data: dict = None, timeout: float = 5):
     url = f"{BACKEND_URL}{endpoint}"
     try:
         if data is not None:
-            r = requests.post(url, json=data, timeout=5)
+            r = requests.post(url, json=data, timeout=timeout)
         else:
-            r = requests.get(url, timeout=5)
+            r = requests.get(url, timeout=timeout)
         r.raise_for_status()
         return r.json()
     except requests.RequestException as e:
@@ -34,6 +36,45 @@ def send_to_backend(endpoint: str, data: dict = None):
         return None
 
 
+def dispense_line(status: dict):
+    """Compact Arduino command for a finished job, or None if not finished yet."""
+    if not status or status.get("status") != "finished":
+        return None
+    result = status.get("result") or {}
+    verdict = "OK" if result.get("dispense") else "SKIP"
+    return f"DISPENSE:{verdict}:{status['job_id']}"
+
+
+async def push_dispense_result(job_id: str):
+    """Long-poll the backend and push DISPENSE:OK/SKIP as soon as the job finishes.
+    Arduino's STATUS_REQ polling remains as a slow fallback if this gives up.
+    """
+    loop = asyncio.get_running_loop()
+    failures = 0
+    while failures < MAX_PUSH_FAILURES:
+        status = await loop.run_in_executor(
+            None, send_to_backend, f"/dispense-status/{job_id}?wait={STATUS_WAIT}", None, STATUS_WAIT + 5
+        )
+        if status is None:
+            failures += 1
+            await asyncio.sleep(OPEN_RETRY_DELAY)
+            continue
+        failures = 0
+        if status.get("status") == "acknowledged":
+            return  # Arduino already handled this job
+        line = dispense_line(status)
+        if line:
+            await write_to_serial(line)
+            return
+    print(f"[WARN] Giving up push for job {job_id}; Arduino will fall back to STATUS_REQ")
+
+
+def _start_push(job_id: str):
+    task = asyncio.create_task(push_dispense_result(job_id))
+    _push_tasks.add(task)
+    task.add_done_callback(_push_tasks.discard)
+
+
 async def serial_writer(ser: serial.Serial):
     while True:
         msg = await serial_queue.get()
@@ -68,16 +109,18 @@ async def serial_reader(ser: serial.Serial):
                         job_id = result["job_id"]
                         ser.write(f"JOB_ID:{job_id}\n".encode())
                         print(f"[→ Arduino] JOB_ID:{job_id}")
+                        _start_push(job_id)
 
                 elif line.startswith("DISPENSE_DONE:"):
                     job_id = line.split(":", 1)[1].strip()
                     send_to_backend(f"/dispense-complete/{job_id}")
 
                 elif line.startswith("STATUS_REQ:"):
+                    # fallback path; results are normally pushed by push_dispense_result
                     job_id = line.split(":", 1)[1].strip()
                     status = send_to_backend(f"/dispense-status/{job_id}")
-                    if status:
-                        msg = json.dumps(status)
+                    msg = dispense_line(status)
+                    if msg:
                         ser.write((msg + "\n").encode())
 
                 else:
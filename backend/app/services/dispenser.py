@@ -9,19 +9,81 @@ MAX_ATTEMPTS = 15
 ATTEMPT_DELAY = 1.5  # seconds between attempts
 
 _lock = threading.Lock()
+_changed = threading.Condition(_lock)  # notified on every job state change
 _jobs = {}  # job_id -> {status, result, attempts, created_at}
+_subscribers = []  # callables invoked as cb(job_id, job_snapshot) on state change
+
+DONE_STATUSES = ("finished", "acknowledged")
+
+def subscribe(callback):
+    """
+    Register callback(job_id, job) to be called after every job state change.
+    job is a shallow copy taken under the lock. Callbacks run on the thread that
+    made the change, so they must be quick and must not block.
+    """
+    with _lock:
+        _subscribers.append(callback)
+
+def unsubscribe(callback):
+    with _lock:
+        try:
+            _subscribers.remove(callback)
+        except ValueError:
+            pass
+
+def _publish(job_id):
+    """Wake long-pollers and notify subscribers. Caller must NOT hold _lock."""
+    with _lock:
+        job = _jobs.get(job_id)
+        snapshot = dict(job) if job else None
+        callbacks = list(_subscribers)
+        _changed.notify_all()
+    if snapshot is None:
+        return
+    for cb in callbacks:
+        try:
+            cb(job_id, snapshot)
+        except Exception:
+            pass
 
 def new_job(metadata=None):
     job_id = str(uuid.uuid4())
     job = {"status": "pending", "result": None, "attempts": 0, "meta": metadata, "created_at": time.time()}
     with _lock:
         _jobs[job_id] = job
+    _publish(job_id)
     return job_id
 
 def get_job(job_id):
     with _lock:
         return _jobs.get(job_id)
 
+def wait_for_job(job_id, statuses=DONE_STATUSES, timeout=30.0):
+    """
+    Block until the job reaches one of `statuses` or `timeout` seconds pass.
+    Returns a snapshot of the job (possibly still not done), or None if unknown.
+    """
+    deadline = time.monotonic() + timeout
+    with _lock:
+        while True:
+            job = _jobs.get(job_id)
+            if job is None or job["status"] in statuses:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            _changed.wait(remaining)
+        return dict(job) if job else None
+
+def acknowledge_job(job_id):
+    with _lock:
+        job = _jobs.get(job_id)
+        if not job:
+            return False
+        job["status"] = "acknowledged"
+    _publish(job_id)
+    return True
+
 def _call_facial_service():
     try:
         r = requests.post(FACIAL_SERVICE_URL, timeout=5)  # adjust if GET or different payload required
@@ -42,6 +104,7 @@ def run_dispense_workflow(job_id):
         if not job:
             return
         job["status"] = "running"
+    _publish(job_id)
 
     for attempt in range(1, MAX_ATTEMPTS + 1):
         verified = _call_facial_service()
@@ -51,9 +114,11 @@ def run_dispense_workflow(job_id):
             with _lock:
                 job["status"] = "finished"
                 job["result"] = {"dispense": True, "reason": "face_verified", "attempts": attempt}
+            _publish(job_id)
             return
         time.sleep(ATTEMPT_DELAY)
 
     with _lock:
         job["status"] = "finished"
         job["result"] = {"dispense": False, "reason": "max_attempts_reached", "attempts": MAX_ATTEMPTS}
+    _publish(job_id)